@@ -0,0 +1,39 @@
+"""Build script for the Windsurf agent.
+
+Project metadata lives in pyproject.toml. This script only adds the optional
+Cython build of the configuration module: when Cython is available,
+``src/config.py`` is compiled to an extension module that shadows the pure
+Python source at import time. The source stays importable as-is for local
+development, and a failed compile falls back to the pure Python module.
+
+Set ``WINDSURF_NO_CYTHON=1`` to skip the compile step entirely.
+"""
+import os
+import sys
+
+from setuptools import setup
+
+ext_modules = []
+
+if not os.getenv("WINDSURF_NO_CYTHON"):
+    try:
+        from Cython.Build import cythonize
+    except ImportError:
+        cythonize = None
+
+    if cythonize is not None:
+        ext_modules = cythonize(
+            ["src/config.py"],
+            language_level=3,
+            compiler_directives={
+                # Pydantic needs real Python functions (validators, classmethods)
+                "binding": True,
+            },
+        )
+        for ext in ext_modules:
+            # A failed compile leaves the pure Python module in place
+            ext.optional = True
+            if sys.platform != "win32":
+                ext.extra_compile_args = ["-O3"]
+
+setup(ext_modules=ext_modules)
@@ -0,0 +1,15 @@
+# Static declarations for config.py, applied only when setup.py compiles the
+# module with Cython. config.py itself remains plain, importable Python.
+cimport cython
+
+
+cpdef str _format_env_value(object value)
+
+
+@cython.locals(lines=list, stack=list, current_prefix=str, env_name=str,
+               i=Py_ssize_t)
+cpdef list _env_file_lines(dict data, str prefix)
+
+
+@cython.locals(field_name=str, env_name=str, kind=int, i=Py_ssize_t)
+cpdef _update_model_from_env(object model, str prefix, object env)
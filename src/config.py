@@ -5,27 +5,188 @@ with support for loading from JSON files and environment variables.
 """
 import json
 import os
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Type, TypeVar, Union
+from typing import Any, Dict, List, Mapping, Optional, Tuple, Type, TypeVar, Union
+
+try:
+    import orjson
+except ImportError:  # orjson is an optional speedup
+    orjson = None
 
 from pydantic import BaseModel, Field, HttpUrl, validator, BaseSettings, root_validator
+from pydantic.config import BaseConfig
+from pydantic.fields import ModelField
 
 # Type variable for generic model parsing
 T = TypeVar('T', bound='BaseModel')
 
-def parse_env_var(name: str, default: Any = None) -> Any:
-    """Parse environment variable with support for JSON deserialization."""
-    value = os.getenv(name, None)
-    if value is None:
-        return default
-    
-    # Try to parse as JSON, fallback to string
+# URL validator for allowed origins, built once at import time rather than
+# per validation (the pydantic v1 counterpart of a cached TypeAdapter)
+_ALLOWED_ORIGIN_URL = ModelField.infer(
+    name='allowed_origins',
+    value=...,
+    annotation=HttpUrl,
+    class_validators=None,
+    config=BaseConfig,
+)
+
+# First characters (after leading whitespace) of values that may be JSON:
+# objects, arrays, strings, numbers, true/false/null and the NaN/Infinity
+# constants json accepts. Anything else is returned as a plain string.
+_JSON_START_CHARS = frozenset('{["-0123456789tfnNI')
+
+
+def _parse_env_value(value: str) -> Any:
+    """Parse an environment variable value as JSON, falling back to the string.
+
+    Uses ``json`` rather than orjson: values are tiny, and orjson differs on
+    big integers, out-of-range floats and lone surrogates.
+    """
+    stripped = value.lstrip()
+    if not stripped or stripped[0] not in _JSON_START_CHARS:
+        return value
     try:
         return json.loads(value)
-    except (json.JSONDecodeError, TypeError):
+    except ValueError:
         return value
 
 
+def parse_env_var(name: str, default: Any = None,
+                  env: Optional[Mapping[str, str]] = None) -> Any:
+    """Parse environment variable with support for JSON deserialization.
+
+    Args:
+        name: Name of the environment variable.
+        default: Value returned when the variable is not set.
+        env: Optional pre-built environment mapping. Defaults to ``os.environ``.
+    """
+    if env is None:
+        env = os.environ
+    value = env.get(name)
+    if value is None:
+        return default
+    return _parse_env_value(value)
+
+
+def construct_model(model_cls: Type[T], data: Dict[str, Any]) -> T:
+    """Build a model from trusted data without running validation.
+
+    Unlike ``BaseModel.construct``, nested model fields given as dictionaries
+    are constructed recursively and keys that are not field aliases are
+    dropped (as validation ignores them), so the result has the same shape as
+    a validated model.
+
+    Args:
+        model_cls: Model class to build.
+        data: Raw field values, keyed by field alias.
+
+    Returns:
+        An instance of ``model_cls``.
+    """
+    values = {}
+    for field in model_cls.__fields__.values():
+        if field.alias not in data:
+            continue
+        value = data[field.alias]
+        if (isinstance(value, dict) and isinstance(field.type_, type)
+                and issubclass(field.type_, BaseModel)):
+            value = construct_model(field.type_, value)
+        values[field.alias] = value
+    return model_cls.construct(**values)
+
+
+# Field kinds used by update_from_env
+_FIELD_SCALAR = 0
+_FIELD_MODEL = 1
+_FIELD_MODEL_LIST = 2
+
+
+@lru_cache(maxsize=None)
+def _env_field_plan(model_cls: Type[BaseModel],
+                    prefix: str) -> Tuple[Tuple[str, str, int], ...]:
+    """Return ``(field_name, env_name, kind)`` for each field of a model.
+
+    The field types of a model class never change, so the reflection needed
+    to tell scalars from nested models is done once per class and prefix.
+    """
+    plan = []
+    for field_name, field in model_cls.__fields__.items():
+        env_name = f"{prefix}{field_name.upper()}"
+        kind = _FIELD_SCALAR
+        if isinstance(field.type_, type) and issubclass(field.type_, BaseModel):
+            if getattr(field.outer_type_, '__origin__', None) is list:
+                kind = _FIELD_MODEL_LIST
+            else:
+                kind = _FIELD_MODEL
+        plan.append((field_name, env_name, kind))
+    return tuple(plan)
+
+
+def _update_model_from_env(model: BaseModel, prefix: str,
+                           env: Mapping[str, str]) -> None:
+    """Apply environment overrides to a model and its nested models.
+
+    Args:
+        model: Model to update in place.
+        prefix: Prefix for this model's environment variables.
+        env: Environment snapshot shared by the whole walk.
+    """
+    for field_name, env_name, kind in _env_field_plan(type(model), prefix):
+        # Handle nested models
+        if kind == _FIELD_MODEL:
+            nested_config = getattr(model, field_name)
+            if nested_config is not None:
+                _update_model_from_env(nested_config, f"{env_name}_", env)
+            continue
+            
+        # Handle list of models
+        if kind == _FIELD_MODEL_LIST:
+            list_configs = getattr(model, field_name, [])
+            for i, item in enumerate(list_configs):
+                _update_model_from_env(item, f"{env_name}_{i}_", env)
+            continue
+            
+        # Handle simple fields
+        env_value = env.get(env_name)
+        if env_value is not None:
+            setattr(model, field_name, _parse_env_value(env_value))
+
+
+def _format_env_value(value: Any) -> str:
+    """Convert a value to a string suitable for an env file."""
+    if isinstance(value, (dict, list)):
+        return json.dumps(value)
+    return str(value)
+
+
+def _env_file_lines(data: Dict[str, Any], prefix: str) -> List[str]:
+    """Flatten configuration data into ``NAME=value`` env file lines.
+
+    Nested dicts and lists of dicts are walked depth-first with a stack of
+    item iterators, so variables come out in the same order as a recursive
+    walk would.
+    """
+    lines = []
+    stack = [(iter(data.items()), '')]
+    while stack:
+        items, current_prefix = stack.pop()
+        for key, value in items:
+            env_name = f"{current_prefix}{key.upper()}"
+            if isinstance(value, dict):
+                # Resume this level once the nested dict is done
+                stack.append((items, current_prefix))
+                stack.append((iter(value.items()), f"{env_name}_"))
+                break
+            if isinstance(value, list) and value and isinstance(value[0], dict):
+                stack.append((items, current_prefix))
+                for i in range(len(value) - 1, -1, -1):
+                    stack.append((iter(value[i].items()), f"{env_name}_{i}_"))
+                break
+            lines.append(f"{prefix}{env_name}={_format_env_value(value)}\n")
+    return lines
+
+
 class MemoryConfig(BaseModel):
     """Configuration for the agent's memory settings."""
     enabled: bool = True
@@ -70,10 +231,18 @@ class SecurityConfig(BaseModel):
     """Security-related configuration."""
     require_authentication: bool = False
     api_key: str = ""
-    allowed_origins: List[Union[HttpUrl, str]] = ["*"]
+    allowed_origins: List[str] = ["*"]
     rate_limit: RateLimitConfig = Field(default_factory=RateLimitConfig)
     cors: CorsConfig = Field(default_factory=CorsConfig)
 
+    @validator('allowed_origins', each_item=True)
+    def parse_allowed_origin(cls, value: str) -> Union[HttpUrl, str]:
+        """Parse an origin as a URL, keeping wildcards and other strings as-is."""
+        if value == '*':
+            return value
+        url, errors = _ALLOWED_ORIGIN_URL.validate(value, {}, loc='allowed_origins')
+        return value if errors else url
+
 
 class HealthCheckConfig(BaseModel):
     """Health check endpoint configuration."""
@@ -114,11 +283,14 @@ class AgentConfig(BaseModel):
     version_control: VersionControlConfig = Field(default_factory=VersionControlConfig)
 
     @classmethod
-    def from_json_file(cls: Type[T], file_path: Union[str, Path]) -> T:
+    def from_json_file(cls: Type[T], file_path: Union[str, Path],
+                       trusted: bool = False) -> T:
         """Load configuration from a JSON file.
         
         Args:
             file_path: Path to the JSON configuration file.
+            trusted: Skip validation and build the models directly. Only use
+                this for configuration files shipped with the agent.
             
         Returns:
             AgentConfig: Loaded configuration.
@@ -127,13 +299,19 @@ class AgentConfig(BaseModel):
             FileNotFoundError: If the configuration file doesn't exist.
             ValidationError: If the configuration is invalid.
         """
-        path = Path(file_path)
-        if not path.exists():
-            raise FileNotFoundError(f"Configuration file not found: {file_path}")
-            
-        with open(path, 'r', encoding='utf-8') as f:
-            config_data = json.load(f)
-            
+        # Read raw bytes; both JSON parsers decode UTF-8 themselves
+        try:
+            with open(file_path, 'rb') as f:
+                data = f.read()
+        except FileNotFoundError as e:
+            raise FileNotFoundError(f"Configuration file not found: {file_path}") from e
+        if orjson is not None:
+            config_data = orjson.loads(data)
+        else:
+            config_data = json.loads(data)
+        
+        if trusted:
+            return construct_model(cls, config_data)
         return cls.parse_obj(config_data)
     
     def to_dict(self) -> Dict[str, Any]:
@@ -144,46 +322,25 @@ class AgentConfig(BaseModel):
         """
         return self.dict(by_alias=True, exclude_unset=True)
     
-    def update_from_env(self) -> None:
+    def update_from_env(self, prefix: str = 'WINDSURF_',
+                        env: Optional[Mapping[str, str]] = None) -> None:
         """Update configuration from environment variables.
         
         This method updates the configuration with values from environment variables.
-        Environment variables should be prefixed with 'WINDSURF_' and use double underscore
-        to denote nested fields (e.g., WINDSURF_LOGGING_LEVEL).
+        Environment variables should be prefixed with 'WINDSURF_' and use an underscore
+        to denote nested fields (e.g., WINDSURF_LOGGING_LEVEL), matching ``to_env_file``.
+        
+        Args:
+            prefix: Prefix for environment variables
+            env: Optional environment snapshot. Defaults to a copy of ``os.environ``.
         """
-        prefix = 'WINDSURF_'
+        if env is None:
+            env = dict(os.environ)
+            # Nothing to override: skip the field walk entirely
+            if not any(key.startswith(prefix) for key in env):
+                return
         
-        for field_name, field in self.__fields__.items():
-            env_name = f"{prefix}{field_name.upper()}"
-            
-            # Handle nested models
-            if hasattr(field.type_, '__base__') and issubclass(field.type_, BaseModel):
-                nested_config = getattr(self, field_name)
-                if nested_config is not None:
-                    nested_config.update_from_env()
-                continue
-                
-            # Handle list of models
-            if (hasattr(field.type_, '__origin__') and 
-                field.type_.__origin__ is list and 
-                hasattr(field.type_.__args__[0], '__base__') and 
-                issubclass(field.type_.__args__[0], BaseModel)):
-                
-                list_configs = getattr(self, field_name, [])
-                for item in list_configs:
-                    item.update_from_env()
-                continue
-                
-            # Handle simple fields
-            env_value = os.getenv(env_name)
-            if env_value is not None:
-                try:
-                    # Try to parse the value as JSON first
-                    parsed_value = json.loads(env_value)
-                    setattr(self, field_name, parsed_value)
-                except (json.JSONDecodeError, TypeError):
-                    # Fall back to string if not valid JSON
-                    setattr(self, field_name, env_value)
+        _update_model_from_env(self, prefix, env)
     
     @classmethod
     def from_env(cls: Type[T], prefix: str = 'WINDSURF_') -> T:
@@ -198,7 +355,7 @@ class AgentConfig(BaseModel):
         # First create a default config
         config = cls()
         # Then update it with environment variables
-        config.update_from_env()
+        config.update_from_env(prefix)
         return config
         
     def to_env_file(self, file_path: Union[str, Path], prefix: str = 'WINDSURF_') -> None:
@@ -209,29 +366,10 @@ class AgentConfig(BaseModel):
             prefix: Prefix for environment variables
         """
         env_lines = [f"# Auto-generated environment variables for {self.__class__.__name__}\n"]
-        
-        def process_value(value: Any) -> str:
-            """Convert a value to a string suitable for an env file."""
-            if isinstance(value, (dict, list)):
-                return json.dumps(value)
-            return str(value)
-        
-        def add_to_env(data: Dict[str, Any], current_prefix: str = '') -> None:
-            """Recursively add config items to environment variables."""
-            for key, value in data.items():
-                env_name = f"{current_prefix}{key.upper()}"
-                if isinstance(value, dict):
-                    add_to_env(value, f"{env_name}_")
-                elif isinstance(value, list) and value and isinstance(value[0], dict):
-                    for i, item in enumerate(value):
-                        add_to_env(item, f"{env_name}_{i}_")
-                else:
-                    env_lines.append(f"{prefix}{env_name}={process_value(value)}\n")
-        
-        add_to_env(self.dict(exclude_unset=True))
+        env_lines.extend(_env_file_lines(self.dict(exclude_unset=True), prefix))
         
         with open(file_path, 'w', encoding='utf-8') as f:
-            f.writelines(env_lines)
+            f.write(''.join(env_lines))
 
 
 def load_config(file_path: Union[str, Path, None] = None, 
@@ -252,13 +390,15 @@ def load_config(file_path: Union[str, Path, None] = None,
     # If no file path provided, try to load from default location
     if file_path is None:
         default_path = Path(".windsurf/agent_settings.json")
-        if default_path.exists():
-            config = AgentConfig.from_json_file(default_path)
-        else:
+        try:
+            config = AgentConfig.from_json_file(default_path, trusted=True)
+        except FileNotFoundError:
             # If default file doesn't exist, create a default config
             config = AgentConfig()
     else:
-        config = AgentConfig.from_json_file(file_path)
+        # Files under .windsurf/ ship with the agent and skip validation
+        trusted = '.windsurf' in Path(file_path).parts
+        config = AgentConfig.from_json_file(file_path, trusted=trusted)
     
     # Apply environment variable overrides if enabled
     if use_env:
@@ -6,18 +6,30 @@ This module serves as the main entry point for the Windsurf agent.
 It initializes the agent, loads tools, and starts the processing loop.
 """
 
+from __future__ import annotations
+
 import asyncio
 import json
 import logging
-import logging.handlers
 import os
+import re
 import signal
 import sys
+import threading
 from pathlib import Path
-from typing import Any, AsyncIterator, Dict, List, Optional, Type, TypeVar, Union, cast
+from typing import (
+    TYPE_CHECKING, Any, AsyncIterator, Dict, List, Optional, Tuple, Type, TypeVar,
+    Union, cast
+)
 
-import aiohttp
-from aiohttp import web
+if TYPE_CHECKING:
+    import aiohttp
+    from aiohttp import web
+
+try:
+    import orjson
+except ImportError:  # orjson is an optional speedup
+    orjson = None
 
 from .config import AgentConfig, load_config
 
@@ -30,10 +42,92 @@ logger = logging.getLogger(__name__)
 
 T = TypeVar('T')
 
+# aiohttp is slow to import, so it is only loaded once HTTP features are used
+_aiohttp: Any = None
+_web: Any = None
+
+
+def _import_aiohttp() -> Any:
+    """Import aiohttp on first use and return the module."""
+    global _aiohttp, _web
+    if _aiohttp is None:
+        import aiohttp
+        from aiohttp import web
+        _aiohttp, _web = aiohttp, web
+    return _aiohttp
+
+
+def _json_dumps(obj: Any) -> str:
+    """Serialize an object to a JSON string, using orjson when available."""
+    if orjson is not None:
+        # Like json.dumps, turn int, float, bool and None keys into strings
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS).decode()
+    return json.dumps(obj, ensure_ascii=False)
+
+
+# Matches the plain ``%(field)s`` placeholders PrecompiledFormatter can split
+_LOG_FIELD_RE = re.compile(r'%\((\w+)\)s')
+
+
+class PrecompiledFormatter(logging.Formatter):
+    """Logging formatter that splits its format string once, up front.
+    
+    ``%(field)s`` placeholders are turned into ``(literal, field)`` pairs so each
+    record is rendered with a single join. Format strings using other
+    conversions or width specifiers fall back to the standard formatter.
+    """
+    
+    def __init__(self, fmt: Optional[str] = None, datefmt: Optional[str] = None) -> None:
+        super().__init__(fmt, datefmt)
+        self._uses_time = super().usesTime()
+        self._fmt_parts = self._split_format(self._style._fmt)
+    
+    @staticmethod
+    def _split_format(fmt: str) -> Optional[List[Tuple[str, Optional[str]]]]:
+        """Split a format string into ``(literal, field)`` pairs.
+        
+        Returns:
+            The pairs, or None if the format needs the standard formatter.
+        """
+        parts: List[Tuple[str, Optional[str]]] = []
+        pos = 0
+        for match in _LOG_FIELD_RE.finditer(fmt):
+            literal = fmt[pos:match.start()]
+            if '%' in literal.replace('%%', ''):
+                return None
+            parts.append((literal.replace('%%', '%'), match.group(1)))
+            pos = match.end()
+        tail = fmt[pos:]
+        if '%' in tail.replace('%%', ''):
+            return None
+        parts.append((tail.replace('%%', '%'), None))
+        return parts
+    
+    def usesTime(self) -> bool:
+        """Check whether the format uses the record creation time."""
+        return self._uses_time
+    
+    def formatMessage(self, record: logging.LogRecord) -> str:
+        """Render the record's fields into the format string."""
+        parts = self._fmt_parts
+        if parts is None:
+            return super().formatMessage(record)
+        pieces = []
+        for literal, field in parts:
+            pieces.append(literal)
+            if field is not None:
+                pieces.append(str(getattr(record, field)))
+        return ''.join(pieces)
+
 
 class Agent:
     """Main agent class that coordinates tools and processing."""
 
+    # Probe responses never change, so they are serialized once up front
+    _ALIVE_BODY: bytes = _json_dumps({'status': 'alive'}).encode()
+    _READY_BODY: bytes = _json_dumps({'status': 'ready'}).encode()
+    _NOT_READY_BODY: bytes = _json_dumps({'status': 'not ready'}).encode()
+
     def __init__(self, config: Optional[Union[Dict[str, Any], AgentConfig]] = None):
         """Initialize the agent with configuration.
         
@@ -48,6 +142,9 @@ class Agent:
         self._web_app: Optional[web.Application] = None
         self._runner: Optional[web.AppRunner] = None
         self._site: Optional[web.TCPSite] = None
+        self._health_body: bytes = b''
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._response_metadata: Dict[str, Any] = {}
         
         # Initialize with provided config or load default
         if config is not None:
@@ -113,9 +210,12 @@ class Agent:
         for handler in root_logger.handlers[:]:
             root_logger.removeHandler(handler)
         
+        # Both handlers share one formatter
+        formatter = PrecompiledFormatter(log_config.format)
+        
         # Configure console handler
         console_handler = logging.StreamHandler()
-        console_handler.setFormatter(logging.Formatter(log_config.format))
+        console_handler.setFormatter(formatter)
         root_logger.addHandler(console_handler)
         
         # Configure file handler if file logging is enabled
@@ -123,16 +223,18 @@ class Agent:
             log_file = Path(log_config.file)
             log_file.parent.mkdir(parents=True, exist_ok=True)
             
-            file_handler = logging.handlers.RotatingFileHandler(
+            from logging.handlers import RotatingFileHandler
+            
+            file_handler = RotatingFileHandler(
                 filename=log_file,
                 maxBytes=log_config.max_size_mb * 1024 * 1024,  # Convert MB to bytes
                 backupCount=log_config.backup_count,
                 encoding='utf-8',
             )
-            file_handler.setFormatter(logging.Formatter(log_config.format))
+            file_handler.setFormatter(formatter)
             root_logger.addHandler(file_handler)
             
-        logger.info(f"Logging configured with level {log_config.level}")
+        logger.info("Logging configured with level %s", log_config.level)
     
     async def get_http_session(self) -> aiohttp.ClientSession:
         """Get or create an HTTP client session.
@@ -141,9 +243,10 @@ class Agent:
             aiohttp.ClientSession: The HTTP client session.
         """
         if self._http_session is None or self._http_session.closed:
+            aiohttp = _import_aiohttp()
             self._http_session = aiohttp.ClientSession(
                 timeout=aiohttp.ClientTimeout(total=30),
-                json_serialize=lambda x: json.dumps(x, ensure_ascii=False)
+                json_serialize=_json_dumps
             )
         return self._http_session
 
@@ -154,7 +257,16 @@ class Agent:
 
         logger.info("Setting up agent...")
         
-        # Initialize components
+        # Response parts that only depend on the config are built once
+        self._loop = asyncio.get_running_loop()
+        self._response_metadata = {
+            'agent': self.config.name,
+            'version': self.config.version
+        }
+        
+        # Initialize components. Memory and tool setup never await, so running
+        # them concurrently would not overlap anything, and awaiting in order
+        # means a failed step leaves no server task bound to the port.
         await self._setup_memory()
         await self._load_tools()
         await self._setup_http_server()
@@ -167,6 +279,15 @@ class Agent:
         if not self.config.monitoring.enabled:
             return
             
+        # Health payload only depends on the config, so serialize it once
+        self._health_body = _json_dumps({
+            'status': 'ok',
+            'version': self.config.version,
+            'name': self.config.name
+        }).encode()
+        
+        web = _import_aiohttp().web
+        
         self._web_app = web.Application()
         self._configure_routes()
         
@@ -183,55 +304,44 @@ class Agent:
         
         try:
             await self._site.start()
-            logger.info(f"HTTP server started on port {self.config.monitoring.port}")
+            logger.info("HTTP server started on port %s", self.config.monitoring.port)
         except Exception as e:
-            logger.error(f"Failed to start HTTP server: {e}")
+            logger.error("Failed to start HTTP server: %s", e)
     
     def _configure_routes(self) -> None:
         """Configure HTTP routes for the web application."""
         if self._web_app is None:
             return
             
+        monitoring = self.config.monitoring
+        health_check = monitoring.health_check
+        router = self._web_app.router
+        
         # Health check endpoints
-        if self.config.monitoring.health_check.enabled:
-            self._web_app.router.add_get(
-                self.config.monitoring.health_check.endpoint,
-                self.health_check_handler
-            )
-            self._web_app.router.add_get(
-                self.config.monitoring.health_check.live_endpoint,
-                self.liveness_handler
-            )
-            self._web_app.router.add_get(
-                self.config.monitoring.health_check.ready_endpoint,
-                self.readiness_handler
-            )
+        if health_check.enabled:
+            router.add_get(health_check.endpoint, self.health_check_handler)
+            router.add_get(health_check.live_endpoint, self.liveness_handler)
+            router.add_get(health_check.ready_endpoint, self.readiness_handler)
         
         # Metrics endpoint
-        if self.config.monitoring.enabled and hasattr(self, 'metrics_handler'):
-            self._web_app.router.add_get(
-                self.config.monitoring.endpoint,
-                self.metrics_handler
-            )
+        if monitoring.enabled and hasattr(self, 'metrics_handler'):
+            router.add_get(monitoring.endpoint, self.metrics_handler)
     
     async def health_check_handler(self, request: web.Request) -> web.Response:
         """Handle health check requests."""
-        return web.json_response({
-            'status': 'ok',
-            'version': self.config.version,
-            'name': self.config.name
-        })
+        return _web.Response(body=self._health_body, content_type='application/json')
     
     async def liveness_handler(self, request: web.Request) -> web.Response:
         """Handle liveness probe requests."""
-        return web.json_response({'status': 'alive'})
+        return _web.Response(body=self._ALIVE_BODY, content_type='application/json')
     
     async def readiness_handler(self, request: web.Request) -> web.Response:
         """Handle readiness probe requests."""
         if self._setup_complete and all(tool.is_ready() for tool in self.tools.values()):
-            return web.json_response({'status': 'ready'})
-        return web.json_response(
-            {'status': 'not ready'},
+            return _web.Response(body=self._READY_BODY, content_type='application/json')
+        return _web.Response(
+            body=self._NOT_READY_BODY,
+            content_type='application/json',
             status=503  # Service Unavailable
         )
 
@@ -257,7 +367,7 @@ class Agent:
         # Ensure tools directory exists
         tools_dir = Path(self.config.tools.directory)
         if not tools_dir.exists():
-            logger.warning(f"Tools directory not found: {tools_dir}")
+            logger.warning("Tools directory not found: %s", tools_dir)
             return
         
         # Add tools directory to Python path
@@ -268,9 +378,9 @@ class Agent:
         try:
             from tools.example_tool import ExampleTool
             self.tools["example"] = ExampleTool()
-            logger.info(f"Loaded tool: example")
+            logger.info("Loaded tool: example")
         except ImportError as e:
-            logger.warning(f"Failed to load example tool: {e}")
+            logger.warning("Failed to load example tool: %s", e)
     
     async def process(self, input_data: Dict[str, Any]) -> Dict[str, Any]:
         """Process input and return response.
@@ -287,7 +397,7 @@ class Agent:
         if not self._setup_complete:
             await self.setup()
 
-        logger.info(f"Processing input: {input_data}")
+        logger.info("Processing input: %s", input_data)
         
         # Validate input
         if not isinstance(input_data, dict):
@@ -299,9 +409,8 @@ class Agent:
             'input': input_data,
             'result': None,
             'metadata': {
-                'agent': self.config.name,
-                'version': self.config.version,
-                'timestamp': asyncio.get_event_loop().time()
+                **self._response_metadata,
+                'timestamp': cast(asyncio.AbstractEventLoop, self._loop).time()
             }
         }
         
@@ -346,12 +455,16 @@ class Agent:
         for sig in (signal.SIGINT, signal.SIGTERM):
             loop.add_signal_handler(sig, lambda: asyncio.create_task(self.shutdown(sig)))
         
+        lines = self._start_input_reader(loop)
+        
         try:
             while True:
                 try:
-                    user_input = await loop.run_in_executor(
-                        None, input, "\nEnter input (or 'exit' to quit): "
-                    )
+                    print("\nEnter input (or 'exit' to quit): ", end='', flush=True)
+                    line = await lines.get()
+                    if line is None:  # End of input
+                        break
+                    user_input = line.rstrip('\n')
                     
                     if user_input.lower() in ('exit', 'quit'):
                         break
@@ -363,15 +476,42 @@ class Agent:
                 except (EOFError, KeyboardInterrupt):
                     break
                 except Exception as e:
-                    logger.error(f"Error processing input: {e}", exc_info=True)
+                    logger.error("Error processing input: %s", e, exc_info=True)
                     print(f"Error: {e}")
                     
         finally:
             await self.cleanup()
     
+    def _start_input_reader(
+        self, loop: asyncio.AbstractEventLoop
+    ) -> asyncio.Queue[Optional[str]]:
+        """Start a background thread that reads stdin lines into a queue.
+        
+        A single reader thread avoids scheduling an executor job per prompt.
+        
+        Args:
+            loop: The running event loop that consumes the lines
+            
+        Returns:
+            asyncio.Queue: Queue of input lines, with None marking end of input
+        """
+        queue: asyncio.Queue[Optional[str]] = asyncio.Queue()
+        
+        def read_lines() -> None:
+            try:
+                for line in iter(sys.stdin.readline, ''):
+                    loop.call_soon_threadsafe(queue.put_nowait, line)
+                loop.call_soon_threadsafe(queue.put_nowait, None)
+            except RuntimeError:
+                # The event loop was closed while we were waiting for input
+                pass
+        
+        threading.Thread(target=read_lines, name='agent-stdin', daemon=True).start()
+        return queue
+    
     async def shutdown(self, sig: signal.Signals) -> None:
         """Handle shutdown signals."""
-        logger.info(f"Received signal {sig.name}, shutting down...")
+        logger.info("Received signal %s, shutting down...", sig.name)
         await self.cleanup()
         asyncio.get_running_loop().stop()
 
@@ -382,35 +522,9 @@ def main() -> None:
         agent = Agent.from_config_file()
         asyncio.run(agent.run())
     except Exception as e:
-        logger.critical(f"Agent crashed: {e}", exc_info=True)
+        logger.critical("Agent crashed: %s", e, exc_info=True)
         sys.exit(1)
 
 
 if __name__ == "__main__":
     main()
-
-        while True:
-            try:
-                user_input = input("\n> ")
-                if user_input.lower() in ('exit', 'quit'):
-                    break
-                    
-                # Process the input
-                response = await self.process({"text": user_input})
-                print("\nResponse:", response)
-                
-            except KeyboardInterrupt:
-                print("\nExiting...")
-                break
-            except Exception as e:
-                logger.error(f"Error processing input: {e}", exc_info=True)
-
-
-async def main():
-    """Main entry point for the agent."""
-    agent = Agent()
-    await agent.run()
-
-
-if __name__ == "__main__":
-    asyncio.run(main())
@@ -0,0 +1,61 @@
+"""
+Vectorized kernel for batched 'add' operations.
+
+Used by ExampleTool.execute_many to add many pairs of numbers in one call.
+NumPy is required for the kernel; when Numba is also installed the kernel is
+JIT-compiled (and cached on disk, so the compile cost is paid once).
+
+Both dependencies are optional and slow to import, so nothing is imported
+until load_add_kernel() is first called.
+"""
+
+from typing import Any, Callable, Optional, Tuple
+
+# Set by load_add_kernel()
+np: Any = None
+
+# (numpy, kernel) once loaded, False if NumPy is not installed
+_loaded: Any = None
+
+
+def _add_kernel(a: Any, b: Any, max_val: float) -> Tuple[Any, Any]:
+    """Add two float64 arrays element-wise and check their bounds.
+
+    Args:
+        a: First operands
+        b: Second operands
+        max_val: Maximum allowed magnitude for each operand
+
+    Returns:
+        The element-wise sums, and a boolean array that is False where either
+        operand exceeds max_val in magnitude (NaN operands pass, as in
+        ExampleTool._handle_add)
+    """
+    out_of_bounds = (np.abs(a) > max_val) | (np.abs(b) > max_val)
+    return a + b, ~out_of_bounds
+
+
+def load_add_kernel() -> Optional[Tuple[Any, Callable[..., Tuple[Any, Any]]]]:
+    """Import NumPy (and Numba) and build the add kernel on first use.
+
+    Returns:
+        The numpy module and the kernel, or None if NumPy is not installed
+    """
+    global np, _loaded
+    if _loaded is None:
+        try:
+            import numpy
+        except ImportError:
+            _loaded = False
+        else:
+            np = numpy
+            try:
+                from numba import njit
+            except ImportError:
+                kernel = _add_kernel
+            else:
+                # fastmath is left off: it would change the NaN handling of
+                # the bounds check
+                kernel = njit(cache=True)(_add_kernel)
+            _loaded = (numpy, kernel)
+    return _loaded or None
@@ -7,18 +7,39 @@ error handling, and resource management.
 """
 
 import asyncio
+import functools
+import inspect
 import logging
 from dataclasses import dataclass
 from enum import Enum, auto
-from typing import Any, Dict, List, Literal, Optional, TypedDict, Union, cast
+from typing import Any, Callable, Dict, List, Literal, Optional, Tuple, TypedDict, Union, cast
+
+try:
+    from ._add_kernel import load_add_kernel
+except ImportError:  # Run directly as a script
+    from _add_kernel import load_add_kernel
 
 # Configure logging
 logger = logging.getLogger(__name__)
 
+# Cached for the per-call log level checks in ExampleTool
+_INFO = logging.INFO
+_log_enabled = logger.isEnabledFor
+
 # Type aliases
 OperationType = Literal["greet", "add"]
 
 
+@functools.lru_cache(maxsize=1024)
+def _greet(name: str) -> str:
+    """Build the greeting for a name.
+    
+    Agent sessions usually greet a small set of names, so greetings are
+    cached and repeated calls return the same string object.
+    """
+    return f"Hello, {name}!"
+
+
 class ToolError(Exception):
     """Base exception for tool-related errors."""
     pass
@@ -34,16 +55,21 @@ class InputValidationError(ToolError):
     pass
 
 
-@dataclass
+@dataclass(frozen=True)
 class ToolConfig:
     """Configuration for the ExampleTool.
     
     Attributes:
         default_name: Default name to use for greeting if none provided
         max_add_value: Maximum allowed value for addition operation
+        max_concurrency: Maximum number of asynchronous handler calls running at once
+        include_metadata: Whether successful results carry metadata; callers
+            that only read status and result can turn this off
     """
     default_name: str = "World"
     max_add_value: float = 1000.0
+    max_concurrency: int = 64
+    include_metadata: bool = True
 
 
 class ExecuteInput(TypedDict, total=False):
@@ -59,7 +85,7 @@ class ExecuteResult(TypedDict):
     status: Literal["success", "error"]
     result: Optional[Any]
     error: Optional[str]
-    metadata: Dict[str, Any]
+    metadata: Optional[Dict[str, Any]]
 
 
 class ExampleTool:
@@ -79,6 +105,15 @@ class ExampleTool:
     description: str = "An example tool that demonstrates tool functionality"
     version: str = "1.0.0"
     
+    # Instances carry no __dict__; subclasses adding attributes must declare
+    # their own __slots__ (or get a __dict__ back by not declaring any)
+    __slots__ = (
+        'config', '_default_name', '_max_add', '_include_metadata', '_sem', '_dispatch',
+    )
+    
+    # Clears the greeting cache shared by all instances
+    clear_greet_cache = staticmethod(_greet.cache_clear)
+    
     def __init__(self, config: Optional[Dict[str, Any]] = None) -> None:
         """Initialize the example tool with configuration.
         
@@ -86,12 +121,25 @@ class ExampleTool:
             config: Optional configuration dictionary for the tool. Can include:
                 - default_name: Default name for greeting operation
                 - max_add_value: Maximum allowed value for addition
+                - include_metadata: Whether successful results carry metadata
                 
         Example:
             >>> tool = ExampleTool({"default_name": "User", "max_add_value": 500})
         """
         self.config = ToolConfig(**config) if config else ToolConfig()
+        # The config is frozen, so hot-path values can be cached on the tool
+        self._default_name = self.config.default_name
+        self._max_add = float(self.config.max_add_value)
+        self._include_metadata = self.config.include_metadata
+        self._sem: Optional[asyncio.Semaphore] = None
         self._setup()
+        # Operation handlers, keyed by operation name. Handlers are plain
+        # functions since they do no I/O; execute() stays async. Subclass
+        # handlers may return coroutines, which run under the concurrency limit.
+        self._dispatch: Dict[str, Callable[[Dict[str, Any]], Any]] = {
+            'greet': self._handle_greet,
+            'add': self._handle_add,
+        }
     
     def _setup(self) -> None:
         """Set up the tool with any required resources.
@@ -120,7 +168,8 @@ class ExampleTool:
                 - status: 'success' or 'error'
                 - result: The operation result (on success)
                 - error: Error message (on error)
-                - metadata: Additional information about the operation
+                - metadata: Additional information about the operation (None
+                  on success when the include_metadata config option is off)
                 
         Raises:
             InputValidationError: If input validation fails
@@ -136,22 +185,28 @@ class ExampleTool:
                 'metadata': {'operation': 'greet', 'input': {...}}
             }
         """
-        logger.info("Executing example tool", extra={"input": input_data})
+        if _log_enabled(_INFO):
+            logger.info("Executing example tool", extra={"input": input_data})
         
         try:
             # Validate input
-            if not isinstance(input_data, dict) or 'operation' not in input_data:
+            if not isinstance(input_data, dict):
                 raise InputValidationError("Input must be a dictionary with an 'operation' key")
             
-            operation = input_data.get('operation', 'greet')
+            operation = input_data.get('operation')
+            if operation is None:
+                raise InputValidationError("Input must be a dictionary with an 'operation' key")
             
-            # Route to the appropriate operation
-            if operation == 'greet':
-                result = await self._handle_greet(input_data)
-            elif operation == 'add':
-                result = await self._handle_add(input_data)
-            else:
+            # Route to the appropriate operation; non-string names (which may
+            # be unhashable) are never registered
+            handler = self._dispatch.get(operation) if isinstance(operation, str) else None
+            if handler is None:
                 raise OperationNotSupportedError(f"Unsupported operation: {operation}")
+            result = handler(input_data)
+            if inspect.isawaitable(result):
+                # Only asynchronous handlers can overlap, so only they are limited
+                async with self._get_semaphore():
+                    result = await result
             
             return {
                 'status': 'success',
@@ -160,18 +215,139 @@ class ExampleTool:
                 'metadata': {
                     'operation': operation,
                     'input': input_data
-                }
+                } if self._include_metadata else None
             }
             
         except ToolError as e:
-            logger.error(f"Tool error: {e}", exc_info=True)
+            logger.error("Tool error: %s", e, exc_info=True)
             return self._create_error_result(str(e), input_data)
         except Exception as e:
             error_msg = f"Unexpected error: {str(e)}"
             logger.exception(error_msg)
             return self._create_error_result(error_msg, input_data)
     
-    async def _handle_greet(self, input_data: Dict[str, Any]) -> str:
+    def _get_semaphore(self) -> asyncio.Semaphore:
+        """Get the semaphore that bounds concurrent operations.
+        
+        Created on first use, since on Python 3.9 asyncio primitives bind to
+        the event loop that is current when they are created.
+        """
+        if self._sem is None:
+            self._sem = asyncio.Semaphore(self.config.max_concurrency)
+        return self._sem
+    
+    async def execute_many(self, inputs: List[ExecuteInput]) -> List[ExecuteResult]:
+        """Execute a batch of inputs, summing 'add' operations in one call.
+        
+        When NumPy is installed, valid 'add' operations are packed into arrays
+        and computed by a single vectorized kernel (JIT-compiled if Numba is
+        installed). Every other input, and any 'add' that fails validation, is
+        passed to execute() concurrently, so it gets the usual result or error
+        and asynchronous handlers stay within ``max_concurrency``.
+        
+        Args:
+            inputs: Inputs in the same format accepted by execute()
+            
+        Returns:
+            One result per input, in input order
+        """
+        # Only the built-in add handler is vectorized; a replaced or overridden
+        # one is called through execute() like every other handler
+        add_handler = self._dispatch.get('add')
+        if getattr(add_handler, '__func__', None) is ExampleTool._handle_add:
+            loaded = load_add_kernel()
+        else:
+            loaded = None
+        if loaded is None:
+            return list(await asyncio.gather(*(self.execute(i) for i in inputs)))
+        np, add_kernel = loaded
+        
+        results: List[Optional[ExecuteResult]] = [None] * len(inputs)
+        positions: List[int] = []
+        a_values: List[float] = []
+        b_values: List[float] = []
+        # Inputs left for execute()
+        pending: List[int] = []
+        
+        for pos, input_data in enumerate(inputs):
+            if isinstance(input_data, dict) and input_data.get('operation') == 'add':
+                try:
+                    a, b = self._parse_add_operands(input_data)
+                except Exception:
+                    # Left to execute(), which reports the error for this input
+                    pass
+                else:
+                    positions.append(pos)
+                    a_values.append(a)
+                    b_values.append(b)
+                    continue
+            pending.append(pos)
+        
+        if positions:
+            if _log_enabled(_INFO):
+                logger.info("Executing %d example tool additions as a batch", len(positions))
+            sums, valid = add_kernel(
+                np.array(a_values, dtype=np.float64),
+                np.array(b_values, dtype=np.float64),
+                self._max_add,
+            )
+            for pos, total, ok in zip(positions, sums.tolist(), valid.tolist()):
+                if ok:
+                    results[pos] = {
+                        'status': 'success',
+                        'result': total,
+                        'error': None,
+                        'metadata': {
+                            'operation': 'add',
+                            'input': inputs[pos]
+                        } if self._include_metadata else None
+                    }
+                else:
+                    pending.append(pos)
+        
+        if pending:
+            executed = await asyncio.gather(*(self.execute(inputs[pos]) for pos in pending))
+            for pos, result in zip(pending, executed):
+                results[pos] = result
+        
+        return cast(List[ExecuteResult], results)
+    
+    def execute_greet_fast(self, name: str) -> str:
+        """Greet a name directly, for callers that already know the operation.
+        
+        Skips input validation, dispatch and result wrapping done by execute().
+        
+        Args:
+            name: The name to greet
+            
+        Returns:
+            A greeting message
+        """
+        return _greet(name)
+    
+    def execute_add_fast(self, a: float, b: float) -> float:
+        """Add two numbers directly, for callers that already know the operation.
+        
+        Skips input validation, dispatch and result wrapping done by execute().
+        
+        Args:
+            a: First number
+            b: Second number
+            
+        Returns:
+            The sum of a and b
+            
+        Raises:
+            InputValidationError: If a or b exceed max_add_value in magnitude
+        """
+        max_val = self._max_add
+        if abs(a) > max_val or abs(b) > max_val:
+            raise InputValidationError(
+                f"Values must not exceed {self.config.max_add_value} in magnitude"
+            )
+        return a + b
+    
+    def _handle_greet(self, input_data: Dict[str, Any]) -> str:
         """Handle the 'greet' operation.
         
         Args:
@@ -180,10 +356,9 @@ class ExampleTool:
         Returns:
             A greeting message
         """
-        name = str(input_data.get('name', self.config.default_name))
-        return f"Hello, {name}!"
+        return _greet(str(input_data.get('name', self._default_name)))
     
-    async def _handle_add(self, input_data: Dict[str, Any]) -> float:
+    def _handle_add(self, input_data: Dict[str, Any]) -> float:
         """Handle the 'add' operation.
         
         Args:
@@ -195,19 +370,24 @@ class ExampleTool:
         Raises:
             InputValidationError: If a or b are not valid numbers or exceed max_add_value
         """
-        try:
-            a = float(input_data.get('a', 0))
-            b = float(input_data.get('b', 0))
+        a, b = self._parse_add_operands(input_data)
+        return self.execute_add_fast(a, b)
+    
+    @staticmethod
+    def _parse_add_operands(input_data: Dict[str, Any]) -> Tuple[float, float]:
+        """Convert the 'a' and 'b' operands of an 'add' input to floats.
+        
+        Args:
+            input_data: Input parameters including 'a' and 'b'
             
-            # Validate input values
-            max_val = self.config.max_add_value
-            if abs(a) > max_val or abs(b) > max_val:
-                raise InputValidationError(
-                    f"Values must not exceed {max_val} in magnitude"
-                )
-                
-            return a + b
+        Returns:
+            The two operands, each defaulting to 0
             
+        Raises:
+            InputValidationError: If a or b are not valid numbers
+        """
+        try:
+            return float(input_data.get('a', 0)), float(input_data.get('b', 0))
         except (TypeError, ValueError) as e:
             raise InputValidationError("Both 'a' and 'b' must be numbers") from e
     
@@ -239,7 +419,8 @@ class ExampleTool:
         to properly release any acquired resources.
         """
         logger.debug("Cleaning up example tool")
-        # Clean up any resources here
+        self.clear_greet_cache()
+        # Clean up any other resources here
     
     def is_ready(self) -> bool:
         """Check if the tool is ready to process requests.
@@ -256,20 +437,30 @@ if __name__ == "__main__":
     import asyncio
     import json
     
+    try:
+        import orjson
+    except ImportError:
+        orjson = None
+    
+    def dumps(obj):
+        if orjson is not None:
+            return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode()
+        return json.dumps(obj, indent=2)
+    
     async def main():
         tool = ExampleTool()
         
         # Test greet operation
         result = await tool.execute({"operation": "greet", "name": "Windsurf"})
-        print("Greet result:", json.dumps(result, indent=2))
+        print("Greet result:", dumps(result))
         
         # Test add operation
         result = await tool.execute({"operation": "add", "a": 5, "b": 3})
-        print("\nAdd result:", json.dumps(result, indent=2))
+        print("\nAdd result:", dumps(result))
         
         # Test error case
         result = await tool.execute({"operation": "unknown"})
-        print("\nError result:", json.dumps(result, indent=2))
+        print("\nError result:", dumps(result))
         
         await tool.cleanup()
     
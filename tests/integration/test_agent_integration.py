@@ -9,66 +9,69 @@ import json
 import os
 import tempfile
 from pathlib import Path
+from types import MappingProxyType
 from typing import Any, Dict
 from unittest.mock import patch
 
+try:
+    import orjson
+except ImportError:  # orjson is an optional speedup
+    orjson = None
+
 import pytest
 from aiohttp import web, ClientSession, ClientResponse
 
 from src.main import Agent, main
 from src.config import AgentConfig
 
-# Test configuration
-TEST_CONFIG = {
+# Test configuration, laid out like AgentConfig. Shared by every test:
+# MappingProxyType only guards the top level, so nested sections must not be
+# modified either.
+TEST_CONFIG = MappingProxyType({
     "name": "test_agent",
     "version": "1.0.0",
     "description": "Test agent configuration",
     "memory": {
         "enabled": True,
-        "max_history": 100
+        "max_entries": 100
     },
     "logging": {
         "level": "DEBUG",
-        "file_path": None,
+        "file": "",  # Console logging only
         "max_size_mb": 10,
         "backup_count": 5
     },
     "security": {
-        "require_auth": False,
+        "require_authentication": False,
         "allowed_origins": ["*"],
         "rate_limit": {
             "enabled": False,
-            "requests_per_minute": 60
+            "max_requests": 60
         }
     },
     "monitoring": {
         "enabled": True,
-        "metrics_endpoint": "/metrics",
-        "health_check_endpoint": "/health"
-    },
-    "http": {
-        "host": "127.0.0.1",
         "port": 8080,
-        "cors_enabled": True
-    },
-    "tools": [
-        {
-            "name": "example_tool",
-            "enabled": True,
-            "config": {
-                "default_name": "Test User",
-                "max_add_value": 1000
-            }
+        "endpoint": "/metrics",
+        "health_check": {
+            "endpoint": "/health"
         }
-    ]
-}
+    },
+    "tools": {
+        "auto_discover": True,
+        "directory": "src/tools"
+    }
+})
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def temp_config_file():
-    """Create a temporary configuration file for testing."""
-    with tempfile.NamedTemporaryFile(mode='w+', suffix='.json', delete=False) as f:
-        json.dump(TEST_CONFIG, f)
+    """Create a temporary configuration file shared by all tests."""
+    with tempfile.NamedTemporaryFile(mode='wb', suffix='.json', delete=False) as f:
+        if orjson is not None:
+            f.write(orjson.dumps(dict(TEST_CONFIG)))
+        else:
+            f.write(json.dumps(dict(TEST_CONFIG)).encode())
         f.flush()
         yield f.name
         
@@ -79,9 +82,12 @@ def temp_config_file():
         pass
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def agent_config(temp_config_file: str) -> AgentConfig:
-    """Create an agent configuration from the test config file."""
+    """Create an agent configuration from the test config file.
+    
+    Parsed once per session; tests that need to modify it should copy it first.
+    """
     return AgentConfig.from_json_file(temp_config_file)
 
 
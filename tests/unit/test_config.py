@@ -0,0 +1,137 @@
+"""
+Unit tests for the agent configuration models.
+"""
+
+import json
+import math
+from pathlib import Path
+
+import pytest
+from src.config import AgentConfig, _parse_env_value, load_config
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+
+
+def test_update_from_env_nested_fields():
+    """Test that nested fields are overridden using their full prefix."""
+    config = AgentConfig()
+    config.update_from_env(env={
+        "WINDSURF_NAME": "env_agent",
+        "WINDSURF_LOGGING_LEVEL": "DEBUG",
+        "WINDSURF_SECURITY_RATE_LIMIT_MAX_REQUESTS": "5",
+    })
+
+    assert config.name == "env_agent"
+    assert config.logging.level == "DEBUG"
+    assert config.security.rate_limit.max_requests == 5
+
+
+@pytest.mark.parametrize("value", [
+    "9100", " 9100", "\t-1.5", " true", "null", ' "quoted"', " [1, 2]", '{"a": 1}',
+    "12345678901234567890123", '"\\ud800"',
+])
+def test_parse_env_value_matches_json(value):
+    """Test that JSON values, including ones with leading whitespace, are parsed."""
+    assert _parse_env_value(value) == json.loads(value)
+
+
+@pytest.mark.parametrize("value", ["NaN", " Infinity", "-Infinity", "1e400"])
+def test_parse_env_value_non_finite(value):
+    """Test that the non-finite constants accepted by json are parsed."""
+    parsed = _parse_env_value(value)
+    assert isinstance(parsed, float)
+    assert math.isnan(parsed) or math.isinf(parsed)
+
+
+@pytest.mark.parametrize("value", ["", "   ", "DEBUG", "nginx", "-v", "true_value", "{broken"])
+def test_parse_env_value_falls_back_to_string(value):
+    """Test that values which are not JSON are returned unchanged."""
+    assert _parse_env_value(value) == value
+
+
+def test_update_from_env_strips_leading_whitespace():
+    """Test that a padded number still overrides an int field as a number."""
+    config = AgentConfig()
+    config.update_from_env(env={"WINDSURF_MONITORING_PORT": " 9100"})
+
+    assert config.monitoring.port == 9100
+
+
+def test_update_from_env_without_overrides():
+    """Test that the config is untouched when no prefixed variables are set."""
+    config = AgentConfig()
+    config.update_from_env(prefix="WINDSURF_TEST_UNSET_")
+
+    assert config == AgentConfig()
+
+
+def test_from_env_uses_prefix(monkeypatch):
+    """Test that from_env reads variables with a custom prefix."""
+    monkeypatch.setenv("CUSTOM_MONITORING_PORT", "9100")
+    config = AgentConfig.from_env(prefix="CUSTOM_")
+
+    assert config.monitoring.port == 9100
+
+
+def test_to_env_file_round_trip(tmp_path):
+    """Test that exported variables can be applied back to a config."""
+    original = AgentConfig.parse_obj({
+        "name": "exported",
+        "logging": {"level": "WARNING"},
+    })
+    env_file = tmp_path / "agent.env"
+    original.to_env_file(env_file)
+
+    env = {}
+    for line in env_file.read_text().splitlines():
+        if line and not line.startswith("#"):
+            key, _, value = line.partition("=")
+            env[key] = value
+
+    restored = AgentConfig()
+    restored.update_from_env(env=env)
+    assert restored.name == "exported"
+    assert restored.logging.level == "WARNING"
+
+
+def test_from_json_file_trusted_matches_validated():
+    """Test that the trusted loader builds the same config as validation."""
+    path = REPO_ROOT / ".windsurf" / "agent_settings.json"
+    validated = AgentConfig.from_json_file(path)
+    trusted = AgentConfig.from_json_file(path, trusted=True)
+
+    assert trusted.dict() == validated.dict()
+
+
+def test_from_json_file_trusted_drops_unknown_keys(tmp_path):
+    """Test that keys validation would ignore are not kept by the trusted loader."""
+    data = json.loads((REPO_ROOT / ".windsurf" / "agent_settings.json").read_text())
+    data["stale_key"] = 1
+    data.setdefault("monitoring", {})["bogus"] = True
+    path = tmp_path / "agent_settings.json"
+    path.write_text(json.dumps(data))
+
+    validated = AgentConfig.from_json_file(path)
+    trusted = AgentConfig.from_json_file(path, trusted=True)
+
+    assert trusted.dict() == validated.dict()
+    assert "stale_key" not in trusted.dict()
+    assert "bogus" not in trusted.monitoring.dict()
+    env_file = tmp_path / ".env"
+    trusted.to_env_file(env_file)
+    assert "STALE_KEY" not in env_file.read_text()
+    assert "BOGUS" not in env_file.read_text()
+
+
+def test_from_json_file_missing():
+    """Test that a missing config file raises FileNotFoundError."""
+    with pytest.raises(FileNotFoundError):
+        AgentConfig.from_json_file("does/not/exist.json")
+
+
+def test_load_config_defaults(tmp_path, monkeypatch):
+    """Test that load_config falls back to defaults without a config file."""
+    monkeypatch.chdir(tmp_path)
+    config = load_config(use_env=False)
+
+    assert config == AgentConfig()
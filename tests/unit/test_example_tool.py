@@ -4,8 +4,11 @@ Unit tests for the ExampleTool class.
 
 import pytest
 import asyncio
+import subprocess
+import sys
+from pathlib import Path
 from unittest.mock import patch, MagicMock
-from src.tools.example_tool import ExampleTool
+from src.tools.example_tool import ExampleTool, InputValidationError, _greet
 
 # Test data
 TEST_CONFIG = {
@@ -13,9 +16,12 @@ TEST_CONFIG = {
     "max_add_value": 1000.0
 }
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def example_tool():
-    """Fixture to provide an initialized ExampleTool instance for testing."""
+    """Fixture to provide an initialized ExampleTool instance for testing.
+    
+    The tool holds no per-test state, so one instance is shared by the module.
+    """
     return ExampleTool(config=TEST_CONFIG)
 
 @pytest.mark.asyncio
@@ -50,8 +56,16 @@ async def test_example_tool_unknown_operation(example_tool):
     result = await example_tool.execute({"operation": "unknown_operation"})
     
     assert result["status"] == "error"
-    assert "Unknown operation" in result["error"]
-    assert result["input"]["operation"] == "unknown_operation"
+    assert "Unsupported operation" in result["error"]
+    assert result["metadata"]["input"]["operation"] == "unknown_operation"
+
+@pytest.mark.asyncio
+async def test_example_tool_non_string_operation(example_tool):
+    """Test that a non-string operation is reported as unsupported."""
+    result = await example_tool.execute({"operation": ["greet"]})
+    
+    assert result["status"] == "error"
+    assert result["error"] == "Unsupported operation: ['greet']"
 
 @pytest.mark.asyncio
 async def test_example_tool_execution_error(example_tool):
@@ -62,7 +76,8 @@ async def test_example_tool_execution_error(example_tool):
     
     # Test with missing operation
     result = await example_tool.execute({})
-    assert result["status"] == "success"  # Default operation is greet
+    assert result["status"] == "error"
+    assert "'operation' key" in result["error"]
 
 @pytest.mark.asyncio
 async def test_example_tool_cleanup(example_tool):
@@ -72,6 +87,18 @@ async def test_example_tool_cleanup(example_tool):
     except Exception as e:
         pytest.fail(f"cleanup() raised {type(e).__name__} unexpectedly!")
 
+@pytest.mark.asyncio
+async def test_example_tool_greet_cache(example_tool):
+    """Test that repeated greetings are served from the cache."""
+    example_tool.clear_greet_cache()
+    first = await example_tool.execute({"operation": "greet", "name": "Cached"})
+    second = await example_tool.execute({"operation": "greet", "name": "Cached"})
+    
+    assert first["result"] is second["result"]
+    
+    await example_tool.cleanup()
+    assert _greet.cache_info().currsize == 0
+
 @pytest.mark.asyncio
 async def test_example_tool_integration():
     """Test the tool's integration with the agent (example)."""
@@ -81,6 +108,99 @@ async def test_example_tool_integration():
     assert result["status"] == "success"
     assert result["result"] == "Hello, Integration!"
 
+@pytest.mark.asyncio
+async def test_example_tool_execute_many(example_tool):
+    """Test that batched execution matches executing each input."""
+    inputs = [
+        {"operation": "add", "a": 2, "b": 3},
+        {"operation": "greet", "name": "Batch"},
+        {"operation": "add", "a": "1.5", "b": 1},
+        {"operation": "add", "a": 5000, "b": 1},
+        {"operation": "add", "a": "not_a_number"},
+    ]
+    
+    results = await example_tool.execute_many(inputs)
+    
+    assert results == [await example_tool.execute(i) for i in inputs]
+    assert [r["status"] for r in results] == ["success", "success", "success", "error", "error"]
+
+@pytest.mark.asyncio
+async def test_example_tool_execute_many_unconvertible_operand(example_tool):
+    """Test that an operand too large for a float only fails its own input."""
+    inputs = [
+        {"operation": "add", "a": 10**400, "b": 1},
+        {"operation": "add", "a": 2, "b": 3},
+    ]
+    
+    results = await example_tool.execute_many(inputs)
+    
+    assert results == [await example_tool.execute(i) for i in inputs]
+    assert [r["status"] for r in results] == ["error", "success"]
+
+@pytest.mark.asyncio
+async def test_example_tool_execute_many_custom_add():
+    """Test that batches call a subclass's add handler instead of the kernel."""
+    class DoublingTool(ExampleTool):
+        __slots__ = ()
+        
+        def _handle_add(self, input_data):
+            return 2 * super()._handle_add(input_data)
+    
+    results = await DoublingTool().execute_many([{"operation": "add", "a": 2, "b": 3}])
+    
+    assert results[0]["result"] == 10.0
+
+def test_example_tool_import_does_not_load_numpy():
+    """Test that the batch kernel's dependencies are only imported on use."""
+    code = "import sys, src.tools.example_tool; print('numpy' in sys.modules)"
+    out = subprocess.run(
+        [sys.executable, "-c", code],
+        cwd=Path(__file__).resolve().parents[2],
+        capture_output=True, text=True, check=True,
+    )
+    assert out.stdout.strip() == "False"
+
+@pytest.mark.asyncio
+async def test_example_tool_execute_many_concurrency():
+    """Test that batched execution bounds running asynchronous handlers."""
+    tool = ExampleTool({"max_concurrency": 2})
+    running = 0
+    peak = 0
+    
+    async def slow_greet(input_data):
+        nonlocal running, peak
+        running += 1
+        peak = max(peak, running)
+        await asyncio.sleep(0)
+        running -= 1
+        return "done"
+    
+    tool._dispatch["greet"] = slow_greet
+    results = await tool.execute_many([{"operation": "greet"}] * 5)
+    
+    assert [r["result"] for r in results] == ["done"] * 5
+    assert peak == 2
+
+@pytest.mark.asyncio
+async def test_example_tool_without_metadata():
+    """Test that successful results can omit metadata."""
+    tool = ExampleTool({"include_metadata": False})
+
+    result = await tool.execute({"operation": "add", "a": 2, "b": 3})
+    assert result["result"] == 5.0
+    assert result["metadata"] is None
+
+    results = await tool.execute_many([{"operation": "add", "a": 2, "b": 3}])
+    assert results == [result]
+
+def test_example_tool_fast_paths(example_tool):
+    """Test the direct greet and add entry points."""
+    assert example_tool.execute_greet_fast("Fast") == "Hello, Fast!"
+    assert example_tool.execute_add_fast(2.0, 3.0) == 5.0
+    
+    with pytest.raises(InputValidationError):
+        example_tool.execute_add_fast(TEST_CONFIG["max_add_value"] + 1, 0)
+
 # Test for error logging
 @pytest.mark.asyncio
 async def test_example_tool_error_logging(caplog, example_tool):
@@ -88,7 +208,7 @@ async def test_example_tool_error_logging(caplog, example_tool):
     with caplog.at_level("ERROR"):
         await example_tool.execute({"operation": "invalid_operation"})
         
-    assert "Error in example tool" in caplog.text
+    assert "Tool error: Unsupported operation: invalid_operation" in caplog.text
 
 # Test for concurrent execution
 @pytest.mark.asyncio
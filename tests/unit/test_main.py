@@ -0,0 +1,90 @@
+"""
+Unit tests for the agent entry point module.
+"""
+
+import asyncio
+import io
+import json
+import logging
+import sys
+
+import pytest
+from src.config import AgentConfig
+from src.main import Agent, PrecompiledFormatter, _json_dumps
+
+DEFAULT_FORMAT = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+
+
+def _make_record() -> logging.LogRecord:
+    return logging.LogRecord(
+        name="test.logger",
+        level=logging.WARNING,
+        pathname=__file__,
+        lineno=10,
+        msg="disk %d%% full",
+        args=(90,),
+        exc_info=None,
+    )
+
+
+@pytest.mark.parametrize("fmt,precompiled", [
+    (DEFAULT_FORMAT, True),
+    ("100%% %(levelname)s: %(message)s %%", True),
+    ("%(levelname)-8s %(message)s", False),
+])
+def test_precompiled_formatter_matches_standard(fmt, precompiled):
+    """Test that PrecompiledFormatter renders exactly like logging.Formatter."""
+    record = _make_record()
+    formatter = PrecompiledFormatter(fmt)
+
+    assert (formatter._fmt_parts is not None) == precompiled
+    assert formatter.format(record) == logging.Formatter(fmt).format(record)
+
+
+def test_json_dumps_matches_json_module():
+    """Test that _json_dumps accepts the same payloads as json.dumps."""
+    payload = {1: "a", 2.5: "b", True: "c", None: "d", "é": ["x", {"n": 1}]}
+
+    assert json.loads(_json_dumps(payload)) == json.loads(json.dumps(payload))
+
+
+@pytest.mark.asyncio
+async def test_start_input_reader_queues_lines_until_eof(monkeypatch):
+    """Test that stdin lines are queued in order, followed by None at EOF."""
+    monkeypatch.setattr(sys, "stdin", io.StringIO("hello\nexit\n"))
+    lines = Agent()._start_input_reader(asyncio.get_running_loop())
+
+    received = [await asyncio.wait_for(lines.get(), timeout=5) for _ in range(3)]
+
+    assert received == ["hello\n", "exit\n", None]
+
+
+@pytest.mark.asyncio
+async def test_process_response_shape(monkeypatch):
+    """Test that process() builds its response with the expected layout."""
+    # Keep the test from replacing the root logger's handlers
+    monkeypatch.setattr(Agent, "_configure_logging", lambda self: None)
+    agent = Agent(AgentConfig(
+        name="unit_agent",
+        version="2.0.0",
+        monitoring={"enabled": False},
+        tools={"auto_discover": False},
+    ))
+    loop = asyncio.get_running_loop()
+
+    before = loop.time()
+    first = await agent.process({"input": "hi"})
+    second = await agent.process({"input": "again"})
+    after = loop.time()
+
+    assert list(first) == ["status", "input", "result", "metadata"]
+    assert first["status"] == "success"
+    assert first["input"] == {"input": "hi"}
+    assert first["result"] is None
+    assert list(first["metadata"]) == ["agent", "version", "timestamp"]
+    assert first["metadata"]["agent"] == "unit_agent"
+    assert first["metadata"]["version"] == "2.0.0"
+    assert before <= first["metadata"]["timestamp"] <= second["metadata"]["timestamp"] <= after
+    # Responses must not share their metadata dicts
+    assert second["input"] == {"input": "again"}
+    assert first["metadata"] is not second["metadata"]